@@ -0,0 +1,89 @@
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.planner import ActionPlanner
+from src.transport import GroqTransport, RecordingTransport, ReplayTransport
+from src.config import groq_api_key
+
+# (command, scene) pairs sent to the planner
+WORKLOAD = [
+    ('pick up the red block', 'scene1'),
+    ('pick up the blue block', 'scene1'),
+    ('grab the coffee mug', 'scene2'),
+    ('look at the green apple', 'scene2'),
+    ('take the red block off the stack', 'scene3'),
+    ('pick up the yellow ball', 'scene3'),
+    ('pick up the red block', 'default'),
+]
+
+def record(log_path: str, store_requests: bool = False):
+    """
+    Run the workload once against the live API and record responses
+    :param log_path: Log file to append to
+    :param store_requests: If True, store each request next to its response
+    """
+    transport = RecordingTransport(
+        GroqTransport(api_key=groq_api_key),
+        log_path,
+        store_requests=store_requests
+    )
+    planner = ActionPlanner(llm_transport=transport)
+    for command, scene in WORKLOAD:
+        planner.plan(command, scene)
+    print(f'Recorded {len(WORKLOAD)} requests to {log_path}')
+
+def replay(log_path: str, requests: int, workers: int, latency_scale: float):
+    """
+    Replay the workload from the log at high rate and report throughput
+    :param log_path: Log file written by record()
+    :param requests: Total number of plans to generate
+    :param workers: Number of concurrent threads
+    :param latency_scale: Latency multiplier (0 = no delay)
+    """
+    transport = ReplayTransport(log_path, latency_scale=latency_scale)
+    planner = ActionPlanner(llm_transport=transport)
+
+    def run_one(i: int) -> float:
+        command, scene = WORKLOAD[i % len(WORKLOAD)]
+        start = time.perf_counter()
+        planner.plan(command, scene)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        latencies = list(pool.map(run_one, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f'Requests:    {requests} ({workers} workers, latency x{latency_scale})')
+    print(f'Throughput:  {requests / elapsed:.1f} plans/s')
+    print(f'Latency p50: {statistics.median(latencies) * 1000:.2f} ms')
+    print(f'Latency p99: {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms')
+
+def main():
+    """Record or replay the planner workload"""
+    parser = argparse.ArgumentParser(description='Record/replay load test for ActionPlanner')
+    parser.add_argument('log', help='Record/replay log file')
+    parser.add_argument('--record', action='store_true', help='Record from the live API')
+    parser.add_argument('--store-requests', action='store_true',
+                        help='Store full requests in the log (with --record)')
+    parser.add_argument('-n', '--requests', type=int, default=10000)
+    parser.add_argument('-w', '--workers', type=int, default=8)
+    parser.add_argument('-s', '--latency-scale', type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.log, args.store_requests)
+    else:
+        replay(args.log, args.requests, args.workers, args.latency_scale)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
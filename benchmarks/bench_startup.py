@@ -0,0 +1,103 @@
+import sys
+import time
+import statistics
+import threading
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PROMPT = 'Pick a scene'
+
+def time_import(module: str, runs: int = 10) -> list[float]:
+    """
+    Time a cold import of a module in a fresh interpreter
+    :param module: Module to import (eg. src.planner)
+    :param runs: Number of runs
+    :return: List of wall-clock times in seconds
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, '-c', f'import {module}'],
+            cwd=ROOT,
+            check=True
+        )
+        times.append(time.perf_counter() - start)
+    return times
+
+def wait_for_prompt(proc: subprocess.Popen, timeout: float) -> str:
+    """
+    Read the child's stdout until the scene prompt appears
+    :param proc: Running main.py process
+    :param timeout: Seconds to wait before giving up
+    :return: Output read so far
+    :raises TimeoutError: if the prompt doesn't appear in time
+    :raises RuntimeError: if main.py exits before showing the prompt
+    """
+    output = []
+    found = threading.Event()
+
+    def reader():
+        # read(1) blocks, so read in a thread and wait on it with a timeout
+        text = ''
+        while PROMPT not in text:
+            char = proc.stdout.read(1)
+            if not char:
+                break
+            output.append(char)
+            text = ''.join(output)
+        found.set()
+
+    threading.Thread(target=reader, daemon=True).start()
+    if not found.wait(timeout):
+        raise TimeoutError(f'No prompt after {timeout}s:\n{"".join(output)}')
+
+    text = ''.join(output)
+    if PROMPT not in text:
+        raise RuntimeError(f'main.py exited before prompt:\n{text}')
+    return text
+
+def time_to_prompt(runs: int = 10, timeout: float = 30.0) -> list[float]:
+    """
+    Time from launching main.py until the scene prompt is shown
+    :param runs: Number of runs
+    :param timeout: Seconds to wait for the prompt in each run
+    :return: List of wall-clock times in seconds
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, '-u', 'main.py'],
+            cwd=ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        try:
+            wait_for_prompt(proc, timeout)
+            times.append(time.perf_counter() - start)
+        finally:
+            # Never leave an orphan main.py behind, even on failure
+            proc.kill()
+            proc.wait()
+    return times
+
+def report(name: str, times: list[float]):
+    """Print summary of timings"""
+    print(f'{name:<20} median {statistics.median(times) * 1000:8.1f} ms   '
+          f'min {min(times) * 1000:8.1f} ms')
+
+def main():
+    """Run startup benchmarks"""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    report('python (baseline)', time_import('sys', runs))
+    report('import src.planner', time_import('src.planner', runs))
+    report('time-to-prompt', time_to_prompt(runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,6 @@ import json
 from pathlib import Path
 
 from src.planner import ActionPlanner
-from src.vision import VisionProcessor
 from src.config import groq_api_key, mock_mode
 
 def print_banner():
@@ -41,13 +40,15 @@ def main():
         return 1
 
     try:
-        vision = VisionProcessor(mock_mode=mock_mode)
         planner = ActionPlanner(
             vision_mock_mode=mock_mode,
             llm_api_key=api_key,
             llm_model='llama-3.1-8b-instant'
         )
 
+        # Reuse the planner's vision processor instead of building a second one
+        vision = planner.vision
+
         print("System initialized successfully!")
 
         # List avialable scenes
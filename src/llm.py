@@ -1,9 +1,9 @@
 import json
 import os
 from typing import Optional
-from groq import Groq
 
 from src.models import Command, Scene, ActionPlan, RobotAction, Position
+from src.transport import Transport, GroqTransport
 
 class LLMClient:
     """
@@ -15,7 +15,8 @@ class LLMClient:
             self,
             provider: str = 'groq',
             api_key: Optional[str] = None,
-            model: str = 'llama-3.1-8b-instant'
+            model: str = 'llama-3.1-8b-instant',
+            transport: Optional[Transport] = None
     ):
         """
         Initialize the LLM client.
@@ -25,6 +26,8 @@ class LLMClient:
                         - 'llama-3.1-70b-versatile' (recommended, best quality)
                         - "llama-3.1-8b-instant" (faster, good quality)
                         - "mixtral-8x7b-32768" (alternative)
+        :param transport: Object used to send requests (eg. RecordingTransport, ReplayTransport).
+                          If None, requests go straight to the provider API
         Environment variables:
             GROQ_API_KEY: API key for Groq (if api_key not provided)
         """
@@ -32,17 +35,32 @@ class LLMClient:
         self.model = model
 
         if provider == 'groq':
-            # Get api key from parameter or environment
-            api_key = api_key or os.getenv('GROQ_API_KEY')
-            if not api_key:
-                raise ValueError(
-                    "Groq API key required. Provide via api_key parameter or "
-                    "set GROQ_API_KEY environment variable."
-                )
-            self.client = Groq(api_key=api_key)
+            if transport is None:
+                # Get api key from parameter or environment
+                api_key = api_key or os.getenv('GROQ_API_KEY')
+                if not api_key:
+                    raise ValueError(
+                        "Groq API key required. Provide via api_key parameter or "
+                        "set GROQ_API_KEY environment variable."
+                    )
+                transport = GroqTransport(api_key=api_key)
+            self.transport = transport
         else:
             raise NotImplementedError(f'Provider "{provider}" not implemented')
 
+    @property
+    def client(self):
+        """
+        Provider SDK client of the underlying transport, created lazily on first use.
+        :return: Provider client
+        :raises AttributeError: if the transport has no SDK client (eg. ReplayTransport)
+        """
+        if not hasattr(self.transport, 'client'):
+            raise AttributeError(
+                f'{type(self.transport).__name__} has no provider client'
+            )
+        return self.transport.client
+
     def generate_plan(self, command: Command, scene: Scene) -> ActionPlan:
         """
         Generate a robot action plan based on command and scene.
@@ -69,10 +87,10 @@ class LLMClient:
         # Create user prompt with command and scene
         user_prompt = self._create_user_prompt(command, scene)
 
-        # Call Groq API
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
+        # Send request through the transport
+        response_text = self.transport.complete(
+            self.model,
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
@@ -81,9 +99,6 @@ class LLMClient:
             response_format={"type": "json_object"}  # Force JSON output
         )
 
-        # parse response
-        response_text = response.choices[0].message.content
-
         # convert json to ActionPlan
         return self._parse_response(response_text, scene)
 
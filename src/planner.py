@@ -4,6 +4,7 @@ from typing import Optional
 from src.models import Command, Scene, ActionPlan
 from src.vision import VisionProcessor
 from src.llm import LLMClient
+from src.transport import Transport
 
 class ActionPlanner:
     """
@@ -15,7 +16,8 @@ class ActionPlanner:
             vision_mock_mode: bool = True,
             llm_provider: str = 'groq',
             llm_api_key: Optional[str] = None,
-            llm_model: str = 'llama-3.1-8b-instant'
+            llm_model: str = 'llama-3.1-8b-instant',
+            llm_transport: Optional[Transport] = None
     ):
         """
         Initializes the action planner
@@ -23,12 +25,14 @@ class ActionPlanner:
         :param llm_provider: LLM provider to use ("groq", future: "ollama", "openai")
         :param llm_api_key: API key for LLM provider
         :param llm_model: Model name to use for LLM
+        :param llm_transport: Transport for LLM requests (eg. ReplayTransport for offline runs)
         """
         self.vision = VisionProcessor(mock_mode=vision_mock_mode)
         self.llm = LLMClient(
             provider=llm_provider,
             api_key=llm_api_key,
-            model=llm_model
+            model=llm_model,
+            transport=llm_transport
         )
 
     def plan(self, command_text: str, image_path: Optional[str] = None) -> ActionPlan:
@@ -0,0 +1,223 @@
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Protocol
+
+class Transport(Protocol):
+    """
+    Anything that can send a chat completion request and return the response text
+    """
+
+    def complete(self, model: str, messages: list[dict], **params) -> str:
+        ...
+
+class GroqTransport:
+    """
+    Sends chat completion requests to the Groq API
+    """
+
+    def __init__(self, api_key: str):
+        """
+        Initialize the Groq transport
+        :param api_key: Groq API key
+        """
+        self._api_key = api_key
+        # SDK client is created on the first request (see `client`)
+        self._client = None
+
+    @property
+    def client(self):
+        """
+        Provider SDK client, imported and created lazily on first use.
+        Keeps groq (and httpx/anyio) out of startup until a real request is made.
+        :return: Provider client
+        """
+        if self._client is None:
+            from groq import Groq
+            self._client = Groq(api_key=self._api_key)
+        return self._client
+
+    def complete(self, model: str, messages: list[dict], **params) -> str:
+        """
+        Send a chat completion request
+        :param model: Model name
+        :param messages: Chat messages
+        :param params: Extra request parameters (temperature, max_tokens, ...)
+        :return: Response text
+        """
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            **params
+        )
+        return response.choices[0].message.content
+
+def request_key(model: str, messages: list[dict], **params) -> str:
+    """
+    Hash a request so identical prompts map to the same log entry
+    :param model: Model name
+    :param messages: Chat messages
+    :param params: Extra request parameters
+    :return: Hex digest identifying the request
+    """
+    payload = json.dumps(
+        {'model': model, 'messages': messages, 'params': params},
+        sort_keys=True,
+        separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+class RecordingTransport:
+    """
+    Wraps another transport and appends every request/response pair to a log.
+    Each line of the log is a compact json record:
+        {"k": prompt hash, "t": latency (s), "r": response text}
+    With store_requests, the record also has "q": {"model", "messages", "params"}
+    so a recorded response can be traced back to the request that produced it.
+
+    Each record is written with a single write under a lock, so lines from
+    concurrent requests never interleave. The log is safe to replay while it is
+    still being appended to: at worst the last line is incomplete and skipped.
+    """
+
+    def __init__(self, inner: Transport, log_path: str, store_requests: bool = False):
+        """
+        Initialize the recording transport
+        :param inner: Transport that actually serves requests (eg. GroqTransport)
+        :param log_path: Path to the append-only log file
+        :param store_requests: If True, store the full request next to its hash
+        """
+        self.inner = inner
+        self.log_path = Path(log_path)
+        self.store_requests = store_requests
+        self._lock = threading.Lock()
+
+        if self.log_path.exists():
+            self._drop_partial_last_line()
+
+    def _drop_partial_last_line(self):
+        """
+        Remove a half-written last line left by an interrupted recording.
+        Otherwise new records would be glued onto it and lost on replay.
+        """
+        with self.log_path.open('r+b') as f:
+            end = f.seek(0, 2)
+            pos = end
+            # Scan backwards for the last newline
+            while pos > 0:
+                step = min(4096, pos)
+                f.seek(pos - step)
+                chunk = f.read(step)
+                idx = chunk.rfind(b'\n')
+                if idx != -1:
+                    pos = pos - step + idx + 1
+                    break
+                pos -= step
+            if pos < end:
+                print(f'Warning: dropping incomplete last line of {self.log_path}')
+                f.truncate(pos)
+
+    @property
+    def client(self):
+        """
+        Provider SDK client of the wrapped transport
+        :return: Provider client
+        """
+        return self.inner.client
+
+    def complete(self, model: str, messages: list[dict], **params) -> str:
+        """
+        Forward the request to the inner transport and record the result
+        :param model: Model name
+        :param messages: Chat messages
+        :param params: Extra request parameters
+        :return: Response text
+        """
+        start = time.perf_counter()
+        response_text = self.inner.complete(model, messages, **params)
+        latency = time.perf_counter() - start
+
+        record = {
+            'k': request_key(model, messages, **params),
+            't': round(latency, 4),
+            'r': response_text
+        }
+        if self.store_requests:
+            record['q'] = {'model': model, 'messages': messages, 'params': params}
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            with self.log_path.open('a', encoding='utf-8') as f:
+                f.write(line)
+
+        return response_text
+
+class ReplayTransport:
+    """
+    Serves recorded responses from a log written by RecordingTransport.
+    If a prompt was recorded several times, its responses are served in turn.
+    """
+
+    def __init__(self, log_path: str, latency_scale: float = 1.0):
+        """
+        Initialize the replay transport
+        :param log_path: Path to a log written by RecordingTransport
+        :param latency_scale: Multiplier for recorded latency.
+                              1.0 = original latency, 0.0 = no delay (max rate)
+        :raises ValueError: if latency_scale is negative, or a record other than
+                            the last line is not valid json
+        """
+        if latency_scale < 0:
+            raise ValueError(f'latency_scale must be >= 0, got {latency_scale}')
+
+        self.latency_scale = latency_scale
+        self._records: dict[str, list[tuple[float, str]]] = {}
+        self._next: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        with Path(log_path).open(encoding='utf-8') as f:
+            lines = f.readlines()
+
+        for lineno, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.decoder.JSONDecodeError as e:
+                # A half-written last line means recording was interrupted
+                # (or is still running), so the rest of the log is usable
+                if lineno == len(lines):
+                    print(f'Warning: skipping incomplete last line {log_path}:{lineno}')
+                    continue
+                raise ValueError(f'Invalid record at {log_path}:{lineno}: {e}')
+            self._records.setdefault(record['k'], []).append((record['t'], record['r']))
+
+    def __len__(self) -> int:
+        """Number of distinct recorded prompts"""
+        return len(self._records)
+
+    def complete(self, model: str, messages: list[dict], **params) -> str:
+        """
+        Return the recorded response for this request
+        :param model: Model name
+        :param messages: Chat messages
+        :param params: Extra request parameters
+        :return: Recorded response text
+        :raises KeyError: if the request was never recorded
+        """
+        key = request_key(model, messages, **params)
+        entries = self._records.get(key)
+        if not entries:
+            raise KeyError(f'No recorded response for request {key}')
+
+        with self._lock:
+            idx = self._next.get(key, 0)
+            self._next[key] = (idx + 1) % len(entries)
+        latency, response_text = entries[idx]
+
+        delay = latency * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+
+        return response_text
@@ -1,79 +1,80 @@
 from typing import Optional
 from src.models import Scene, DetectedObject, Position
 
+# Mock scenes are trusted literals, so skip pydantic validation at import time
 MOCK_SCENES = {
-    "scene1": Scene(
+    "scene1": Scene.model_construct(
         objects=[
-            DetectedObject(
+            DetectedObject.model_construct(
                 name='red_block',
                 object_type='block',
-                position=Position(x=0.5, y=0.2, z=0.0),
+                position=Position.model_construct(x=0.5, y=0.2, z=0.0),
                 confidence=0.95
             ),
-            DetectedObject(
+            DetectedObject.model_construct(
                 name='blue_block',
                 object_type='block',
-                position=Position(x=0.3, y=0.1, z=0.0),
+                position=Position.model_construct(x=0.3, y=0.1, z=0.0),
                 confidence=0.92
             )
         ],
         description='Table with red and blue blocks'
     ),
 
-    'scene2': Scene(
+    'scene2': Scene.model_construct(
         objects=[
-            DetectedObject(
+            DetectedObject.model_construct(
                 name='coffee_mug',
                 object_type='cup',
-                position=Position(x=0.2, y=0.3, z=0.0),
+                position=Position.model_construct(x=0.2, y=0.3, z=0.0),
                 confidence=0.91
             ),
-            DetectedObject(
+            DetectedObject.model_construct(
                 name='red_apple',
                 object_type='fruit',
-                position=Position(x=0.0, y=0.2, z=0.0),
+                position=Position.model_construct(x=0.0, y=0.2, z=0.0),
                 confidence=0.94
             ),
-            DetectedObject(
+            DetectedObject.model_construct(
                 name='green_apple',
                 object_type='fruit',
-                position=Position(x=0.1, y=0.25, z=0.0),
+                position=Position.model_construct(x=0.1, y=0.25, z=0.0),
                 confidence=0.91
             )
         ],
         description='Kitchen counter with mug and apples'
     ),
 
-    'scene3': Scene(
+    'scene3': Scene.model_construct(
         objects=[
-            DetectedObject(
+            DetectedObject.model_construct(
                 name='blue_block_base',
                 object_type='block',
-                position=Position(x=0.4, y=0.15, z=0.0),
+                position=Position.model_construct(x=0.4, y=0.15, z=0.0),
                 confidence=0.96
             ),
-            DetectedObject(
+            DetectedObject.model_construct(
                 name="red_block_stacked",
                 object_type="block",
-                position=Position(x=0.4, y=0.15, z=0.05),
+                position=Position.model_construct(x=0.4, y=0.15, z=0.05),
                 confidence=0.88
             ),
-            DetectedObject(
+            DetectedObject.model_construct(
                 name="yellow_ball",
                 object_type="ball",
-                position=Position(x=-0.2, y=0.3, z=0.0),
+                position=Position.model_construct(x=-0.2, y=0.3, z=0.0),
                 confidence=0.93
             )
         ],
         description="Table with stacked blocks and a yellow ball"
     ),
 
-    "default": Scene(
+    "default": Scene.model_construct(
         objects=[
-            DetectedObject(
+            DetectedObject.model_construct(
                 name="red_block",
                 object_type="block",
-                position=Position(x=0.3, y=0.2, z=0.0),
+                position=Position.model_construct(x=0.3, y=0.2, z=0.0),
                 confidence=0.90
             )
         ],
@@ -0,0 +1,47 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Builds the planner the way main.py does, optionally touches the SDK client,
+# then reports which provider modules were imported
+SCRIPT = """
+import sys, json
+import main
+from src.planner import ActionPlanner
+
+planner = ActionPlanner(
+    vision_mock_mode=main.mock_mode,
+    llm_api_key='x',
+    llm_model='llama-3.1-8b-instant'
+)
+vision = planner.vision
+vision.list_available_scenes()
+if {touch_client}:
+    planner.llm.client
+print(json.dumps({{name: name in sys.modules for name in ('groq', 'httpx')}}))
+"""
+
+def loaded_modules(touch_client: bool) -> dict:
+    """Run SCRIPT in a fresh interpreter and return which SDK modules are loaded"""
+    result = subprocess.run(
+        [sys.executable, '-c', SCRIPT.format(touch_client=touch_client)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+def test_provider_sdk_not_imported_at_startup():
+    pytest.importorskip('pydantic')
+    assert loaded_modules(touch_client=False) == {'groq': False, 'httpx': False}
+
+def test_provider_sdk_imported_on_first_client_access():
+    pytest.importorskip('pydantic')
+    pytest.importorskip('groq')
+    assert loaded_modules(touch_client=True) == {'groq': True, 'httpx': True}
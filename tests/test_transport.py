@@ -0,0 +1,135 @@
+import json
+
+import pytest
+
+from src.transport import request_key, RecordingTransport, ReplayTransport
+
+MESSAGES = [{'role': 'user', 'content': 'hi'}]
+
+# Canned LLM response for the default mock scene
+PLAN_JSON = json.dumps({
+    'actions': [
+        {
+            'type': 'move_to',
+            'target': 'red_block',
+            'end_effector': 'right_hand',
+            'position': {'x': 0.3, 'y': 0.2, 'z': 0.0},
+            'parameters': {}
+        },
+        {
+            'type': 'grasp',
+            'target': 'red_block',
+            'end_effector': 'right_hand',
+            'position': None,
+            'parameters': {}
+        }
+    ],
+    'confidence': 1.0,
+    'reasoning': 'Object red_block exists in the scene.'
+})
+
+class StubTransport:
+    """Returns canned responses in order and counts calls"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = 0
+
+    def complete(self, model, messages, **params):
+        response = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        return response
+
+def test_request_key_is_stable():
+    # Pinned so changes to the hashing scheme don't silently invalidate old logs
+    assert request_key('m', MESSAGES, temperature=0.3) == '9472bb08eefc770d843ac221cfb88bfb'
+
+def test_request_key_depends_on_params():
+    assert request_key('m', MESSAGES, temperature=0.3) != request_key('m', MESSAGES, temperature=0.5)
+    assert request_key('m', MESSAGES) != request_key('other', MESSAGES)
+
+def test_record_then_replay_round_robin(tmp_path):
+    log = tmp_path / 'log.jsonl'
+    recorder = RecordingTransport(StubTransport(['r1', 'r2']), log)
+    assert recorder.complete('m', MESSAGES, temperature=0.3) == 'r1'
+    assert recorder.complete('m', MESSAGES, temperature=0.3) == 'r2'
+
+    replay = ReplayTransport(log, latency_scale=0)
+    assert len(replay) == 1
+    responses = [replay.complete('m', MESSAGES, temperature=0.3) for _ in range(3)]
+    assert responses == ['r1', 'r2', 'r1']
+
+def test_replay_unrecorded_request_raises(tmp_path):
+    log = tmp_path / 'log.jsonl'
+    RecordingTransport(StubTransport(['r1']), log).complete('m', MESSAGES)
+
+    replay = ReplayTransport(log, latency_scale=0)
+    with pytest.raises(KeyError):
+        replay.complete('m', MESSAGES, temperature=0.3)
+
+def test_negative_latency_scale_rejected(tmp_path):
+    log = tmp_path / 'log.jsonl'
+    log.write_text('')
+    with pytest.raises(ValueError):
+        ReplayTransport(log, latency_scale=-1)
+
+def test_store_requests(tmp_path):
+    log = tmp_path / 'log.jsonl'
+    RecordingTransport(StubTransport(['r1']), log).complete('m', MESSAGES)
+    RecordingTransport(StubTransport(['r2']), log, store_requests=True).complete('m', MESSAGES, temperature=0.3)
+
+    plain, stored = [json.loads(line) for line in log.read_text().splitlines()]
+    assert 'q' not in plain
+    assert stored['q'] == {'model': 'm', 'messages': MESSAGES, 'params': {'temperature': 0.3}}
+
+def test_truncated_last_line_skipped(tmp_path):
+    log = tmp_path / 'log.jsonl'
+    RecordingTransport(StubTransport(['r1']), log).complete('m', MESSAGES)
+    with log.open('a') as f:
+        f.write('{"k":"abc","t":0.1,')
+
+    replay = ReplayTransport(log, latency_scale=0)
+    assert len(replay) == 1
+    assert replay.complete('m', MESSAGES) == 'r1'
+
+def test_recording_after_interrupted_run(tmp_path):
+    log = tmp_path / 'log.jsonl'
+    RecordingTransport(StubTransport(['r1']), log).complete('m', MESSAGES)
+    with log.open('a') as f:
+        f.write('{"k":"abc","t":0.1,')
+
+    # A new run must not glue its records onto the fragment
+    recorder = RecordingTransport(StubTransport(['r2', 'r3']), log)
+    recorder.complete('m', MESSAGES, temperature=0.3)
+    recorder.complete('m', MESSAGES, temperature=0.5)
+
+    replay = ReplayTransport(log, latency_scale=0)
+    assert len(replay) == 3
+    assert replay.complete('m', MESSAGES) == 'r1'
+    assert replay.complete('m', MESSAGES, temperature=0.3) == 'r2'
+    assert replay.complete('m', MESSAGES, temperature=0.5) == 'r3'
+
+def test_invalid_middle_line_reports_location(tmp_path):
+    log = tmp_path / 'log.jsonl'
+    log.write_text('{"k":"abc",\n')
+    RecordingTransport(StubTransport(['r1']), log).complete('m', MESSAGES)
+
+    with pytest.raises(ValueError, match=r'log\.jsonl:1'):
+        ReplayTransport(log)
+
+def test_planner_record_replay_round_trip(tmp_path):
+    pytest.importorskip('pydantic')
+    from src.planner import ActionPlanner
+
+    log = tmp_path / 'log.jsonl'
+    stub = StubTransport([PLAN_JSON])
+    recorded = ActionPlanner(llm_transport=RecordingTransport(stub, log)).plan('pick up the red block')
+
+    # A fresh planner must build the same prompt, so the replay key matches
+    replayed = ActionPlanner(
+        llm_transport=ReplayTransport(log, latency_scale=0)
+    ).plan('pick up the red block')
+
+    assert stub.calls == 1
+    assert replayed == recorded
+    assert [action.type for action in replayed.actions] == ['move_to', 'grasp']